@@ -10,33 +10,113 @@
 # More Helper Functions
 # Dynamically limit sentences types to parse
 
-from math import floor, modf
+from math import modf
 
-# Import utime or time for fix time handling
+# Import utime or time for fix time handling, picking the clock functions once
 try:
     # Assume running on MicroPython
     import utime
+
+    _fix_clock = utime.ticks_ms
+
+    def _ms_since(fix_time):
+        return utime.ticks_diff(utime.ticks_ms(), fix_time)
+
 except ImportError:
     # Otherwise default to time module for non-embedded implementations
-    # Should still support millisecond resolution.
+    # Integer milliseconds from the monotonic clock, like ticks_ms() and unaffected by wall clock changes
     import time
 
+    def _fix_clock():
+        return time.monotonic_ns() // 1000000
+
+    def _ms_since(fix_time):
+        return time.monotonic_ns() // 1000000 - fix_time
+
+
+# Month names for the long date format
+_MONTHS = ('January', 'February', 'March', 'April', 'May',
+           'June', 'July', 'August', 'September', 'October',
+           'November', 'December')
+
+# Bytes update() ignores, stripped from update_bytes() input in one pass
+_UNPRINTABLE = bytes(range(10)) + bytes(range(127, 256))
+
+
+def _xor_bytes(data):
+    """XOR together all the bytes in data to produce an NMEA checksum"""
+    crc_xor = 0
+    for c in data:
+        crc_xor ^= c
+    return crc_xor
+
+
+def _int_or_none(field):
+    """Convert an optional integer NMEA field, giving None if it is empty or malformed"""
+    try:
+        return int(field)
+    except ValueError:
+        return None
+
+
+def _split_coordinate(coordinate_string):
+    """Split an NMEA (d)ddmm.mmmm coordinate field into integer degrees and float minutes. The minutes are the two
+    digits before the decimal point onward, so degrees of any width (e.g. unpadded longitudes, or none at all for
+    0 degrees) are read correctly"""
+    point = coordinate_string.find('.')
+    if point < 0:
+        point = len(coordinate_string)
+    if point < 2:
+        raise ValueError('no minutes in coordinate')
+    return int(coordinate_string[:point - 2] or 0), float(coordinate_string[point - 2:])
+
+
+def _decimal_degrees(coordinate):
+    """Convert a [degrees, decimal minutes, hemisphere] coordinate to [decimal degrees, hemisphere]"""
+    decimal_degrees = coordinate[0] + (coordinate[1] / 60)
+    return [decimal_degrees, coordinate[2]]
+
+
+def _degrees_minutes_seconds(coordinate):
+    """Convert a [degrees, decimal minutes, hemisphere] coordinate to [degrees, minutes, seconds, hemisphere]"""
+    fractional_minutes, whole_minutes = modf(coordinate[1])
+    return [coordinate[0], int(whole_minutes), round(fractional_minutes * 60), coordinate[2]]
+
 
 class MicropyGPS(object):
     """GPS NMEA Sentence Parser. Creates object that stores all relevant GPS data and statistics.
-    Parses sentences one character at a time using update(). """
+    Parses sentences one character at a time using update(), or a buffer at a time using update_bytes(). """
+
+    # Instance attributes, grouped as in __init__; no per object __dict__ is needed
+    __slots__ = ('sentence_active', 'active_segment', 'process_crc', 'gps_segments', '_sentence', 'crc_xor',
+                 'char_count', 'fix_time',
+                 'crc_fails', 'clean_sentences', 'parsed_sentences',
+                 'log_handle', 'log_en', '_log_buffer',
+                 'timestamp', 'date', 'local_offset', '_date_cache',
+                 '_latitude', '_longitude', 'coord_format', 'speed', 'course', 'altitude', 'geoid_height',
+                 'satellites_in_view', 'satellites_in_use', 'satellites_used', 'last_sv_sentence',
+                 'total_sv_sentences', 'satellite_data', 'hdop', 'pdop', 'vdop', 'valid', 'fix_stat', 'fix_type')
 
     # Max Number of Characters a valid sentence can be (based on GGA sentence)
     SENTENCE_LIMIT = 90
-    __HEMISPHERES = ('N', 'S', 'E', 'W')
+    __LATITUDE_HEMISPHERES = ('N', 'S')
+    __LONGITUDE_HEMISPHERES = ('E', 'W')
     __NO_FIX = 1
     __FIX_2D = 2
     __FIX_3D = 3
     __DIRECTIONS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE', 'S', 'SSW', 'SW', 'WSW', 'W',
                     'WNW', 'NW', 'NNW')
-    __MONTHS = ('January', 'February', 'March', 'April', 'May',
-                'June', 'July', 'August', 'September', 'October',
-                'November', 'December')
+    # Day of month with its ordinal suffix, indexed by day (0 - 31)
+    __DAY_ORDINALS = tuple(str(day) + ('st' if day in (1, 21, 31) else 'nd' if day in (2, 22) else
+                                       'rd' if day in (3, 23) else 'th') for day in range(32))
+    # Index into speed and label for each speed_string() unit
+    __SPEED_UNITS = {'knot': (0, ' knots'), 'mph': (1, ' mph'), 'kph': (2, ' km/h')}
+    # Short date layouts, filled from (day, month, year) with each field zero padded to two digits
+    __SHORT_DATE_FORMATS = {'s_dmy': '{0:02d}/{1:02d}/{2:02d}', 's_mdy': '{1:02d}/{0:02d}/{2:02d}'}
+    # Conversions for coordinate formats other than the stored ddm form
+    __COORD_FORMATTERS = {'dd': _decimal_degrees, 'dms': _degrees_minutes_seconds}
+    # Readable layouts for each coordinate format, filled from the converted coordinate
+    __COORD_STRING_FORMATS = {'dd': '{0}° {1}', 'dms': '{0}° {1}\' {2}" {3}', 'ddm': "{0}° {1}' {2}"}
 
     def __init__(self, local_offset=0, location_formatting='ddm'):
         """
@@ -54,6 +134,7 @@ class MicropyGPS(object):
         self.active_segment = 0
         self.process_crc = False
         self.gps_segments = []
+        self._sentence = bytearray()
         self.crc_xor = 0
         self.char_count = 0
         self.fix_time = 0
@@ -68,6 +149,7 @@ class MicropyGPS(object):
         # Logging Related
         self.log_handle = None
         self.log_en = False
+        self._log_buffer = bytearray()
 
         #####################
         # Data From Sentences
@@ -75,6 +157,7 @@ class MicropyGPS(object):
         self.timestamp = [0, 0, 0.0]
         self.date = [0, 0, 0]
         self.local_offset = local_offset
+        self._date_cache = (None, None, None, '')
 
         # Position/Motion
         self._latitude = [0, 0.0, 'N']
@@ -105,28 +188,14 @@ class MicropyGPS(object):
     @property
     def latitude(self):
         """Format Latitude Data Correctly"""
-        if self.coord_format == 'dd':
-            decimal_degrees = self._latitude[0] + (self._latitude[1] / 60)
-            return [decimal_degrees, self._latitude[2]]
-        elif self.coord_format == 'dms':
-            minute_parts = modf(self._latitude[1])
-            seconds = round(minute_parts[0] * 60)
-            return [self._latitude[0], int(minute_parts[1]), seconds, self._latitude[2]]
-        else:
-            return self._latitude
+        formatter = self.__COORD_FORMATTERS.get(self.coord_format)
+        return formatter(self._latitude) if formatter else self._latitude
 
     @property
     def longitude(self):
         """Format Longitude Data Correctly"""
-        if self.coord_format == 'dd':
-            decimal_degrees = self._longitude[0] + (self._longitude[1] / 60)
-            return [decimal_degrees, self._longitude[2]]
-        elif self.coord_format == 'dms':
-            minute_parts = modf(self._longitude[1])
-            seconds = round(minute_parts[0] * 60)
-            return [self._longitude[0], int(minute_parts[1]), seconds, self._longitude[2]]
-        else:
-            return self._longitude
+        formatter = self.__COORD_FORMATTERS.get(self.coord_format)
+        return formatter(self._longitude) if formatter else self._longitude
 
     ########################################
     # Logging Related Functions
@@ -152,6 +221,7 @@ class MicropyGPS(object):
         Closes the log file handler and disables further logging
         """
         try:
+            self.write_log('')  # Flush any buffered characters first
             self.log_handle.close()
         except AttributeError:
             print("Invalid Handle")
@@ -161,9 +231,12 @@ class MicropyGPS(object):
         return True
 
     def write_log(self, log_string):
-        """Attempts to write the last valid NMEA sentence character to the active file handler
+        """Attempts to write log_string to the active file handler, after any characters update() has buffered
         """
         try:
+            if self._log_buffer:
+                self.log_handle.write(self._log_buffer.decode())
+                self._log_buffer = bytearray()
             self.log_handle.write(log_string)
         except TypeError:
             return False
@@ -176,14 +249,16 @@ class MicropyGPS(object):
         """Parse Recommended Minimum Specific GPS/Transit data (RMC)Sentence.
         Updates UTC timestamp, latitude, longitude, Course, Speed, Date, and fix status
         """
+        segs = self.gps_segments
 
         # UTC Timestamp
         try:
-            utc_string = self.gps_segments[1]
+            utc_string = segs[1]
 
             if utc_string:  # Possible timestamp found
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
+                # One int() for HHMM, split into hours and minutes arithmetically
+                hours, minutes = divmod(int(utc_string[0:4]), 100)
+                hours = (hours + self.local_offset) % 24
                 seconds = float(utc_string[4:])
                 self.timestamp = [hours, minutes, seconds]
             else:  # No Time stamp yet
@@ -194,14 +269,16 @@ class MicropyGPS(object):
 
         # Date stamp
         try:
-            date_string = self.gps_segments[9]
+            date_string = segs[9]
 
             # Date string printer function assumes to be year >=2000,
             # date_string() must be supplied with the correct century argument to display correctly
             if date_string:  # Possible date stamp found
-                day = int(date_string[0:2])
-                month = int(date_string[2:4])
-                year = int(date_string[4:6])
+                # One int() for DDMMYY, split into day, month and year arithmetically
+                if len(date_string) < 6:
+                    return False
+                day, month_year = divmod(int(date_string[0:6]), 10000)
+                month, year = divmod(month_year, 100)
                 self.date = (day, month, year)
             else:  # No Date stamp yet
                 self.date = (0, 0, 0)
@@ -210,42 +287,30 @@ class MicropyGPS(object):
             return False
 
         # Check Receiver Data Valid Flag
-        if self.gps_segments[2] == 'A':  # Data from Receiver is Valid/Has Fix
+        if segs[2] == 'A':  # Data from Receiver is Valid/Has Fix
 
             # Longitude / Latitude
             try:
                 # Latitude
-                l_string = self.gps_segments[3]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[4]
+                lat_degs, lat_mins = _split_coordinate(segs[3])
+                lat_hemi = segs[4]
 
                 # Longitude
-                l_string = self.gps_segments[5]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[6]
+                lon_degs, lon_mins = _split_coordinate(segs[5])
+                lon_hemi = segs[6]
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi not in self.__LATITUDE_HEMISPHERES:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi not in self.__LONGITUDE_HEMISPHERES:
                 return False
 
-            # Speed
+            # Speed and Course
             try:
-                spd_knt = float(self.gps_segments[7])
-            except ValueError:
-                return False
-
-            # Course
-            try:
-                if self.gps_segments[8]:
-                    course = float(self.gps_segments[8])
-                else:
-                    course = 0.0
+                spd_knt = float(segs[7])
+                course = float(segs[8]) if segs[8] else 0.0
             except ValueError:
                 return False
 
@@ -274,14 +339,16 @@ class MicropyGPS(object):
     def gpgll(self):
         """Parse Geographic Latitude and Longitude (GLL)Sentence. Updates UTC timestamp, latitude,
         longitude, and fix status"""
+        segs = self.gps_segments
 
         # UTC Timestamp
         try:
-            utc_string = self.gps_segments[5]
+            utc_string = segs[5]
 
             if utc_string:  # Possible timestamp found
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
+                # One int() for HHMM, split into hours and minutes arithmetically
+                hours, minutes = divmod(int(utc_string[0:4]), 100)
+                hours = (hours + self.local_offset) % 24
                 seconds = float(utc_string[4:])
                 self.timestamp = [hours, minutes, seconds]
             else:  # No Time stamp yet
@@ -291,28 +358,24 @@ class MicropyGPS(object):
             return False
 
         # Check Receiver Data Valid Flag
-        if self.gps_segments[6] == 'A':  # Data from Receiver is Valid/Has Fix
+        if segs[6] == 'A':  # Data from Receiver is Valid/Has Fix
 
             # Longitude / Latitude
             try:
                 # Latitude
-                l_string = self.gps_segments[1]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[2]
+                lat_degs, lat_mins = _split_coordinate(segs[1])
+                lat_hemi = segs[2]
 
                 # Longitude
-                l_string = self.gps_segments[3]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[4]
+                lon_degs, lon_mins = _split_coordinate(segs[3])
+                lon_hemi = segs[4]
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi not in self.__LATITUDE_HEMISPHERES:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi not in self.__LONGITUDE_HEMISPHERES:
                 return False
 
             # Update Object Data
@@ -332,9 +395,10 @@ class MicropyGPS(object):
 
     def gpvtg(self):
         """Parse Track Made Good and Ground Speed (VTG) Sentence. Updates speed and course"""
+        segs = self.gps_segments
         try:
-            course = float(self.gps_segments[1]) if self.gps_segments[1] else 0.0
-            spd_knt = float(self.gps_segments[5]) if self.gps_segments[5] else 0.0
+            course = float(segs[1]) if segs[1] else 0.0
+            spd_knt = float(segs[5]) if segs[5] else 0.0
         except ValueError:
             return False
 
@@ -346,15 +410,17 @@ class MicropyGPS(object):
     def gpgga(self):
         """Parse Global Positioning System Fix Data (GGA) Sentence. Updates UTC timestamp, latitude, longitude,
         fix status, satellites in use, Horizontal Dilution of Precision (HDOP), altitude, geoid height and fix status"""
+        segs = self.gps_segments
 
         try:
             # UTC Timestamp
-            utc_string = self.gps_segments[1]
+            utc_string = segs[1]
 
             # Skip timestamp if receiver doesn't have on yet
             if utc_string:
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
+                # One int() for HHMM, split into hours and minutes arithmetically
+                hours, minutes = divmod(int(utc_string[0:4]), 100)
+                hours = (hours + self.local_offset) % 24
                 seconds = float(utc_string[4:])
             else:
                 hours = 0
@@ -362,17 +428,17 @@ class MicropyGPS(object):
                 seconds = 0.0
 
             # Number of Satellites in Use
-            satellites_in_use = int(self.gps_segments[7])
+            satellites_in_use = int(segs[7])
 
             # Get Fix Status
-            fix_stat = int(self.gps_segments[6])
+            fix_stat = int(segs[6])
 
         except (ValueError, IndexError):
             return False
 
         try:
-            # Horizontal Dilution of Precision
-            hdop = float(self.gps_segments[8])
+            # Horizontal Dilution of Precision, left empty by receivers without a fix
+            hdop = float(segs[8]) if segs[8] else 0.0
         except (ValueError, IndexError):
             hdop = 0.0
 
@@ -382,29 +448,25 @@ class MicropyGPS(object):
             # Longitude / Latitude
             try:
                 # Latitude
-                l_string = self.gps_segments[2]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[3]
+                lat_degs, lat_mins = _split_coordinate(segs[2])
+                lat_hemi = segs[3]
 
                 # Longitude
-                l_string = self.gps_segments[4]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[5]
+                lon_degs, lon_mins = _split_coordinate(segs[4])
+                lon_hemi = segs[5]
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi not in self.__LATITUDE_HEMISPHERES:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi not in self.__LONGITUDE_HEMISPHERES:
                 return False
 
             # Altitude / Height Above Geoid
             try:
-                altitude = float(self.gps_segments[9])
-                geoid_height = float(self.gps_segments[11])
+                altitude = float(segs[9])
+                geoid_height = float(segs[11])
             except ValueError:
                 altitude = 0
                 geoid_height = 0
@@ -431,31 +493,33 @@ class MicropyGPS(object):
         """Parse GNSS DOP and Active Satellites (GSA) sentence. Updates GPS fix type, list of satellites used in
         fix calculation, Position Dilution of Precision (PDOP), Horizontal Dilution of Precision (HDOP), Vertical
         Dilution of Precision, and fix status"""
+        segs = self.gps_segments
+
+        # Sentence must run to the VDOP field ahead of the checksum
+        if len(segs) < 19:
+            return False
 
         # Fix Type (None,2D or 3D)
         try:
-            fix_type = int(self.gps_segments[2])
+            fix_type = int(segs[2])
         except ValueError:
             return False
 
         # Read All (up to 12) Available PRN Satellite Numbers
-        sats_used = []
-        for sats in range(12):
-            sat_number_str = self.gps_segments[3 + sats]
-            if sat_number_str:
-                try:
-                    sat_number = int(sat_number_str)
-                    sats_used.append(sat_number)
-                except ValueError:
-                    return False
-            else:
-                break
+        # PRNs are packed at the front of the 12 fields; the first empty field ends the list
+        sat_fields = segs[3:15]
+        if '' in sat_fields:
+            sat_fields = sat_fields[:sat_fields.index('')]
+        try:
+            sats_used = [int(sat_number_str) for sat_number_str in sat_fields]
+        except ValueError:
+            return False
 
-        # PDOP,HDOP,VDOP
+        # PDOP,HDOP,VDOP; receivers without a fix leave them empty
         try:
-            pdop = float(self.gps_segments[15])
-            hdop = float(self.gps_segments[16])
-            vdop = float(self.gps_segments[17])
+            pdop = float(segs[15])
+            hdop = float(segs[16])
+            vdop = float(segs[17])
         except ValueError:
             return False
 
@@ -476,10 +540,11 @@ class MicropyGPS(object):
     def gpgsv(self):
         """Parse Satellites in View (GSV) sentence. Updates number of SV Sentences,the number of the last SV sentence
         parsed, and data on each satellite present in the sentence"""
+        segs = self.gps_segments
         try:
-            num_sv_sentences = int(self.gps_segments[1])
-            current_sv_sentence = int(self.gps_segments[2])
-            sats_in_view = int(self.gps_segments[3])
+            num_sv_sentences = int(segs[1])
+            current_sv_sentence = int(segs[2])
+            sats_in_view = int(segs[3])
         except ValueError:
             return False
 
@@ -494,36 +559,34 @@ class MicropyGPS(object):
         else:
             sat_segment_limit = 20  # Non-last sentences have 4 satellites and thus read up to position 20
 
-        # Try to recover data for up to 4 satellites in sentence
-        for sats in range(4, sat_segment_limit, 4):
-
-            # If a PRN is present, grab satellite data
-            if self.gps_segments[sats]:
-                try:
-                    sat_id = int(self.gps_segments[sats])
-                except (ValueError,IndexError):
-                    return False
+        # Sentence fields without the trailing checksum, padded so a short final satellite reads as empty fields
+        segs = segs[:-1] + ['', '', '', '']
 
-                try:  # elevation can be null (no value) when not tracking
-                    elevation = int(self.gps_segments[sats+1])
-                except (ValueError,IndexError):
-                    elevation = None
+        # Each satellite is a PRN, elevation, azimuth, SNR group of fields starting at position 4
+        prns = segs[4:max(sat_segment_limit, 0):4]
+        elevations = segs[5::4]
+        azimuths = segs[6::4]
+        snrs = segs[7::4]
 
-                try:  # azimuth can be null (no value) when not tracking
-                    azimuth = int(self.gps_segments[sats+2])
-                except (ValueError,IndexError):
-                    azimuth = None
+        # Try to recover data for up to 4 satellites in sentence
+        for prn, elevation, azimuth, snr in zip(prns, elevations, azimuths, snrs):
 
-                try:  # SNR can be null (no value) when not tracking
-                    snr = int(self.gps_segments[sats+3])
-                except (ValueError,IndexError):
-                    snr = None
             # If no PRN is found, then the sentence has no more satellites to read
-            else:
+            if not prn:
                 break
 
-            # Add Satellite Data to Sentence Dict
-            satellite_dict[sat_id] = (elevation, azimuth, snr)
+            # Add Satellite Data to Sentence Dict; elevation, azimuth and SNR can be null (no value) when not tracking
+            try:
+                satellite_dict[int(prn)] = (int(elevation) if elevation else None,
+                                            int(azimuth) if azimuth else None,
+                                            int(snr) if snr else None)
+            except ValueError:
+                # A malformed PRN spoils the sentence, any other malformed field is stored as null
+                try:
+                    sat_id = int(prn)
+                except ValueError:
+                    return False
+                satellite_dict[sat_id] = (_int_or_none(elevation), _int_or_none(azimuth), _int_or_none(snr))
 
         # Update Object Data
         self.total_sv_sentences = num_sv_sentences
@@ -546,6 +609,7 @@ class MicropyGPS(object):
     def new_sentence(self):
         """Adjust Object Flags in Preparation for a New Sentence"""
         self.gps_segments = ['']
+        self._sentence = bytearray()
         self.active_segment = 0
         self.crc_xor = 0
         self.sentence_active = True
@@ -554,90 +618,197 @@ class MicropyGPS(object):
 
     def update(self, new_char):
         """Process a new input char and updates GPS object if necessary based on special characters ('$', ',', '*')
-        Function builds a list of received string that are validate by CRC prior to parsing by the  appropriate
-        sentence function. Returns sentence type on successful parse, None otherwise"""
+        new_char may be a one character string or an integer byte value, as yielded by iterating over uart.read().
+        Function collects the sentence body in a bytearray, splits it into a list of strings once the checksum
+        marker ('*') arrives, and validates it by CRC prior to parsing by the appropriate sentence function.
+        Returns sentence type on successful parse, None otherwise"""
 
         valid_sentence = False
 
-        # Validate new_char is a printable char
-        ascii_char = ord(new_char)
+        # Work on the byte value; convert chars once
+        if isinstance(new_char, str):
+            ascii_char = ord(new_char)
+        else:
+            ascii_char = new_char
 
+        # Validate new_char is a printable char
         if 10 <= ascii_char <= 126:
-            self.char_count += 1
+            char_count = self.char_count + 1
+            self.char_count = char_count
 
-            # Write Character to log file if enabled
+            # Buffer Character for the log file if enabled, writing it out a line at a time
             if self.log_en:
-                self.write_log(new_char)
+                self._log_buffer.append(ascii_char)
+                if ascii_char == 10 or len(self._log_buffer) > self.SENTENCE_LIMIT:
+                    self.write_log('')
 
             # Check if a new string is starting ($)
-            if new_char == '$':
+            if ascii_char == 36:
                 self.new_sentence()
                 return None
 
             elif self.sentence_active:
 
-                # Check if sentence is ending (*)
-                if new_char == '*':
-                    self.process_crc = False
-                    self.active_segment += 1
+                # Check if sentence is ending (*), split the collected body into its segments
+                if ascii_char == 42:
+                    if self.process_crc:
+                        self.process_crc = False
+                        self.crc_xor = _xor_bytes(self._sentence)
+                        self.gps_segments = self._sentence.decode().split(',')
                     self.gps_segments.append('')
+                    self.active_segment = len(self.gps_segments) - 1
                     return None
 
-                # Check if a section is ended (,), Create a new substring to feed
+                # Still in the body of the sentence, segment separators (,) included: store the character
+                elif self.process_crc:
+                    self._sentence.append(ascii_char)
+
+                # Check if a section of the checksum is ended (,), Create a new substring to feed
                 # characters to
-                elif new_char == ',':
+                elif ascii_char == 44:
                     self.active_segment += 1
                     self.gps_segments.append('')
 
                 # Store All Other printable character and check CRC when ready
                 else:
-                    self.gps_segments[self.active_segment] += new_char
-
-                    # When CRC input is disabled, sentence is nearly complete
-                    if not self.process_crc:
-
-                        if len(self.gps_segments[self.active_segment]) == 2:
-                            try:
-                                final_crc = int(self.gps_segments[self.active_segment], 16)
-                                if self.crc_xor == final_crc:
-                                    valid_sentence = True
-                                else:
-                                    self.crc_fails += 1
-                            except ValueError:
-                                pass  # CRC Value was deformed and could not have been correct
-
-                # Update CRC
-                if self.process_crc:
-                    self.crc_xor ^= ascii_char
+                    crc_segment = self.gps_segments[self.active_segment] + chr(ascii_char)
+                    self.gps_segments[self.active_segment] = crc_segment
+
+                    # CRC input is disabled, sentence is nearly complete
+                    if len(crc_segment) == 2:
+                        try:
+                            final_crc = int(crc_segment, 16)
+                            if self.crc_xor == final_crc:
+                                valid_sentence = True
+                            else:
+                                self.crc_fails += 1
+                        except ValueError:
+                            pass  # CRC Value was deformed and could not have been correct
 
                 # If a Valid Sentence Was received and it's a supported sentence, then parse it!!
                 if valid_sentence:
-                    self.clean_sentences += 1  # Increment clean sentences received
-                    self.sentence_active = False  # Clear Active Processing Flag
-
-                    if self.gps_segments[0] in self.supported_sentences:
-
-                        # parse the Sentence Based on the message type, return True if parse is clean
-                        if self.supported_sentences[self.gps_segments[0]](self):
-
-                            # Let host know that the GPS object was updated by returning parsed sentence type
-                            self.parsed_sentences += 1
-                            return self.gps_segments[0]
+                    parsed = self._parse_sentence()
+                    if parsed:
+                        return parsed
 
                 # Check that the sentence buffer isn't filling up with Garage waiting for the sentence to complete
-                if self.char_count > self.SENTENCE_LIMIT:
+                if char_count > self.SENTENCE_LIMIT:
                     self.sentence_active = False
 
         # Tell Host no new sentence was parsed
         return None
 
+    def _parse_sentence(self):
+        """Hand a sentence that passed its CRC check to the appropriate sentence function. Returns sentence type on
+        a clean parse, None otherwise"""
+        self.clean_sentences += 1  # Increment clean sentences received
+        self.sentence_active = False  # Clear Active Processing Flag
+
+        # Look up the parser for the message type once; unsupported sentences have none
+        sentence_type = self.gps_segments[0]
+        parser = self.supported_sentences.get(sentence_type)
+
+        # parse the Sentence Based on the message type, return True if parse is clean
+        if parser and parser(self):
+
+            # Let host know that the GPS object was updated by returning parsed sentence type
+            self.parsed_sentences += 1
+            return sentence_type
+
+        return None
+
+    def update_bytes(self, buf):
+        """Process a buffer of raw bytes (bytes, bytearray or memoryview, e.g. straight from uart.read()) in a single
+        call. Sentences are located with bytes.find(), checked and split in bulk rather than a character at a time,
+        including one whose start arrived in an earlier buffer; anything else (a sentence cut off by the end of the
+        buffer, a failed CRC) goes through the same state machine as update(), so results are identical either way.
+        Returns the sentence type of the last sentence parsed from the buffer, None otherwise"""
+        if not isinstance(buf, bytes):
+            buf = bytes(buf)
+
+        # update() skips characters outside the printable range; drop them here up front as well
+        if buf and (min(buf) < 10 or max(buf) > 126):
+            try:
+                buf = buf.translate(None, _UNPRINTABLE)
+            except AttributeError:  # MicroPython bytes have no translate()
+                buf = bytes(c for c in buf if 10 <= c <= 126)
+
+        # Log the whole buffer in one write; characters passed on to update() below must not be logged again
+        log_en = self.log_en
+        if log_en:
+            self.write_log(buf.decode())
+            self.log_en = False
+
+        parsed = None
+        pos = 0
+        end = len(buf)
+        bulk = True  # Whether the sentence in progress may still be completed in bulk
+        sentence_limit = self.SENTENCE_LIMIT
+        update = self.update
+        try:
+            while pos < end:
+                if not self.sentence_active:
+                    start = buf.find(b'$', pos)
+                    if start < 0:  # Nothing but noise between sentences left
+                        self.char_count += end - pos
+                        break
+
+                    # Start the new sentence just as update() does on '$'
+                    self.new_sentence()
+                    pos = start + 1
+                    bulk = True
+                    continue
+
+                # Complete the sentence in progress (...*hh), which may have begun in an earlier buffer, in one go
+                # provided it doesn't hit the sentence limit
+                if bulk and self.process_crc:
+                    bulk = False
+                    star = buf.find(b'*', pos)
+                    if 0 <= star and star + 3 <= end and self.char_count + star - pos + 2 <= sentence_limit:
+                        restart = buf.find(b'$', pos, star)
+                        if restart >= 0:  # Sentence was abandoned for a new one, go again from there
+                            self.sentence_active = False
+                            pos = restart
+                            continue
+
+                        body = self._sentence + buf[pos:star]
+                        crc_xor = _xor_bytes(body)
+
+                        crc_string = buf[star + 1:star + 3].decode()
+                        try:
+                            valid_sentence = int(crc_string, 16) == crc_xor
+                        except ValueError:
+                            valid_sentence = False
+
+                        if valid_sentence:
+                            self._sentence = body
+                            self.gps_segments = body.decode().split(',')
+                            self.gps_segments.append(crc_string)
+                            self.active_segment = len(self.gps_segments) - 1
+                            self.crc_xor = crc_xor
+                            self.char_count += star - pos + 3
+                            self.process_crc = False
+                            sentence = self._parse_sentence()
+                            if sentence:
+                                parsed = sentence
+                            pos = star + 3
+                            continue
+
+                    # Incomplete or faulty, leave the rest of this sentence to the character state machine
+
+                sentence = update(buf[pos])
+                if sentence:
+                    parsed = sentence
+                pos += 1
+        finally:
+            self.log_en = log_en
+
+        return parsed
+
     def new_fix_time(self):
         """Updates a high resolution counter with current time when fix is updated. Currently only triggered from
         GGA, GSA and RMC sentences"""
-        try:
-            self.fix_time = utime.ticks_ms()
-        except NameError:
-            self.fix_time = time.time()
+        self.fix_time = _fix_clock()
 
     #########################################
     # User Helper Functions
@@ -675,62 +846,48 @@ class MicropyGPS(object):
         if self.fix_time == 0:
             return -1
 
-        # Try calculating fix time using utime; if not running MicroPython
-        # time.time() returns a floating point value in secs
-        try:
-            current = utime.ticks_diff(utime.ticks_ms(), self.fix_time)
-        except NameError:
-            current = (time.time() - self.fix_time) * 1000  # ms
-
-        return current
+        return _ms_since(self.fix_time)
 
     def compass_direction(self):
         """
         Determine a cardinal or inter-cardinal direction based on current course.
         :return: string
         """
-        # Calculate the offset for a rotated compass
-        if self.course >= 348.75:
-            offset_course = 360 - self.course
-        else:
-            offset_course = self.course + 11.25
-
-        # Each compass point is separated by 22.5 degrees, divide to find lookup value
-        dir_index = floor(offset_course / 22.5)
+        # Rotate the compass by half a point, then each compass point is separated by 22.5 degrees, divide to
+        # find lookup value. Courses from 348.75 up to 360 land on 16, which wraps back round to North
+        dir_index = int((self.course + 11.25) / 22.5) & 0x0F
 
-        final_dir = self.__DIRECTIONS[dir_index]
+        return self.__DIRECTIONS[dir_index]
 
-        return final_dir
+    def _coordinate_string(self, coordinate):
+        """Format a stored [degrees, decimal minutes, hemisphere] coordinate in the current coord_format"""
+        coord_format = self.coord_format
+        formatter = self.__COORD_FORMATTERS.get(coord_format)
+        if formatter:
+            coordinate = formatter(coordinate)
+        coord_templates = self.__COORD_STRING_FORMATS
+        return coord_templates.get(coord_format, coord_templates['ddm']).format(*coordinate)
 
     def latitude_string(self):
         """
         Create a readable string of the current latitude data
         :return: string
         """
-        if self.coord_format == 'dd':
-            formatted_latitude = self.latitude
-            lat_string = str(formatted_latitude[0]) + '° ' + str(self._latitude[2])
-        elif self.coord_format == 'dms':
-            formatted_latitude = self.latitude
-            lat_string = str(formatted_latitude[0]) + '° ' + str(formatted_latitude[1]) + "' " + str(formatted_latitude[2]) + '" ' + str(formatted_latitude[3])
-        else:
-            lat_string = str(self._latitude[0]) + '° ' + str(self._latitude[1]) + "' " + str(self._latitude[2])
-        return lat_string
+        return self._coordinate_string(self._latitude)
 
     def longitude_string(self):
         """
         Create a readable string of the current longitude data
         :return: string
         """
-        if self.coord_format == 'dd':
-            formatted_longitude = self.longitude
-            lon_string = str(formatted_longitude[0]) + '° ' + str(self._longitude[2])
-        elif self.coord_format == 'dms':
-            formatted_longitude = self.longitude
-            lon_string = str(formatted_longitude[0]) + '° ' + str(formatted_longitude[1]) + "' " + str(formatted_longitude[2]) + '" ' + str(formatted_longitude[3])
-        else:
-            lon_string = str(self._longitude[0]) + '° ' + str(self._longitude[1]) + "' " + str(self._longitude[2])
-        return lon_string
+        return self._coordinate_string(self._longitude)
+
+    def position_string(self):
+        """
+        Create a readable string of the current position, latitude then longitude, for logging or display
+        :return: string
+        """
+        return self.latitude_string() + ', ' + self.longitude_string()
 
     def speed_string(self, unit='kph'):
         """
@@ -738,20 +895,15 @@ class MicropyGPS(object):
         :param unit: string of 'kph','mph, or 'knot'
         :return:
         """
-        if unit == 'mph':
-            speed_string = str(self.speed[1]) + ' mph'
+        # Position in self.speed and unit label, kph is the default unit
+        speed_index, unit_str = self.__SPEED_UNITS.get(unit, self.__SPEED_UNITS['kph'])
+        speed = self.speed[speed_index]
 
-        elif unit == 'knot':
-            if self.speed[0] == 1:
-                unit_str = ' knot'
-            else:
-                unit_str = ' knots'
-            speed_string = str(self.speed[0]) + unit_str
-
-        else:
-            speed_string = str(self.speed[2]) + ' km/h'
+        # A single knot is not plural
+        if speed == 1 and speed_index == 0:
+            unit_str = ' knot'
 
-        return speed_string
+        return str(speed) + unit_str
 
     def date_string(self, formatting='s_mdy', century='20'):
         """
@@ -765,55 +917,39 @@ class MicropyGPS(object):
         :return: date_string  string with long or short format date
         """
 
+        # Reuse the last string built while the date and arguments are unchanged; the date is compared as a tuple
+        # since it may be held as a list (the initial value, or one assigned by the user)
+        date = self.date
+        date_cache = self._date_cache
+        if date_cache[0] == tuple(date) and date_cache[1] == formatting and date_cache[2] == century:
+            return date_cache[3]
+
         # Long Format Januray 1st, 2014
         if formatting == 'long':
-            # Retrieve Month string from private set
-            month = self.__MONTHS[self.date[1] - 1]
-
-            # Determine Date Suffix
-            if self.date[0] in (1, 21, 31):
-                suffix = 'st'
-            elif self.date[0] in (2, 22):
-                suffix = 'nd'
-            elif self.date[0] == (3, 23):
-                suffix = 'rd'
-            else:
-                suffix = 'th'
-
-            day = str(self.date[0]) + suffix  # Create Day String
+            # Create Day String with its suffix
+            day = self.__DAY_ORDINALS[date[0]] if date[0] < 32 else str(date[0]) + 'th'
 
-            year = century + str(self.date[2])  # Create Year String
-
-            date_string = month + ' ' + day + ', ' + year  # Put it all together
+            # Put month name, day and year together in one pass
+            date_string = '{} {}, {}{:02d}'.format(_MONTHS[date[1] - 1], day, century, date[2])
 
         else:
-            # Add leading zeros to day string if necessary
-            if self.date[0] < 10:
-                day = '0' + str(self.date[0])
-            else:
-                day = str(self.date[0])
-
-            # Add leading zeros to month string if necessary
-            if self.date[1] < 10:
-                month = '0' + str(self.date[1])
-            else:
-                month = str(self.date[1])
-
-            # Add leading zeros to year string if necessary
-            if self.date[2] < 10:
-                year = '0' + str(self.date[2])
-            else:
-                year = str(self.date[2])
-
-            # Build final string based on desired formatting
-            if formatting == 's_dmy':
-                date_string = day + '/' + month + '/' + year
-
-            else:  # Default date format
-                date_string = month + '/' + day + '/' + year
+            # Build final string based on desired formatting, s_mdy is the default date format
+            date_formats = self.__SHORT_DATE_FORMATS
+            date_string = date_formats.get(formatting, date_formats['s_mdy']).format(*date)
 
+        self._date_cache = (tuple(date), formatting, century, date_string)
         return date_string
 
+    def status_string(self):
+        """
+        Create a one line summary of the current date, time, position and speed, for logging or display
+        MM/DD/YY HH:MM:SS position speed
+        :return: string
+        """
+        timestamp = self.timestamp
+        return '{} {:02d}:{:02d}:{:02d} {} {}'.format(self.date_string(), timestamp[0], timestamp[1], int(timestamp[2]),
+                                                      self.position_string(), self.speed_string())
+
     # All the currently supported NMEA sentences
     supported_sentences = {'GPRMC': gprmc, 'GLRMC': gprmc,
                            'GPGGA': gpgga, 'GLGGA': gpgga,
@@ -1,3 +1,4 @@
+import sys
 from pyb import UART
 from pyb import ExtInt
 from pyb import Pin
@@ -15,6 +16,14 @@ def pps_callback(line):
 
 print('GPS Interrupt Tester')
 
+# Template for the status report written after every update
+REPORT = ('UTC Timestamp: {}\n'
+          'Date: {}\n'
+          'Latitude: {}\n'
+          'Longitude: {}\n'
+          'Horizontal Dilution of Precision: {}\n'
+          '\n')
+
 # Instantiate the micropyGPS object
 my_gps = MicropyGPS()
 
@@ -36,12 +45,10 @@ while 1:
     # Update the GPS Object when flag is tripped
     if new_data:
         while uart.any():
-            my_gps.update(chr(uart.readchar()))  # Note the conversion to to chr, UART outputs ints normally
-        
-        print('UTC Timestamp:', my_gps.timestamp)
-        print('Date:', my_gps.date_string('long'))
-        print('Latitude:', my_gps.latitude_string())
-        print('Longitude:', my_gps.longitude_string())
-        print('Horizontal Dilution of Precision:', my_gps.hdop)
-        print()
+            # Drain whatever has stacked up in one read and parse the whole buffer in one call
+            my_gps.update_bytes(uart.read(uart.any()))
+
+        # Build the whole report first and write it out in one go
+        sys.stdout.write(REPORT.format(my_gps.timestamp, my_gps.date_string('long'), my_gps.latitude_string(),
+                                       my_gps.longitude_string(), my_gps.hdop))
         new_data = False  # Clear the flag
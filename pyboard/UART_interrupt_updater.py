@@ -0,0 +1,58 @@
+import gc
+import sys
+from pyb import UART
+from micropyGPS import MicropyGPS
+
+# Global Flag to Start GPS data Processing
+new_data = False
+
+
+# Callback Function
+def rx_idle_callback(uart):
+    global new_data  # Use Global to trigger update
+    new_data = True
+
+
+print('GPS UART Interrupt Tester')
+
+# Template for the status report written after every update
+REPORT = ('UTC Timestamp: {}\n'
+          'Date: {}\n'
+          'Latitude: {}\n'
+          'Longitude: {}\n'
+          'Horizontal Dilution of Precision: {}\n'
+          '\n')
+
+# Instantiate the micropyGPS object
+my_gps = MicropyGPS()
+
+# Setup the connection to your GPS here
+# This example uses UART 3 with RX on pin Y10
+# Baudrate is 9600bps, with the standard 8 bits, 1 stop bit, no parity
+# The UART driver fills read_buf_len from its own RX interrupt, so the buffer is the ring buffer the
+# main loop drains; make it large enough to hold a full burst of sentences
+uart = UART(3, 9600, read_buf_len=1000)
+
+# The RX idle interrupt fires once the line goes quiet after a burst of characters, so there is no
+# need to poll uart.any() or wire up the PPS pin to know when a batch of sentences is waiting
+uart.irq(trigger=UART.IRQ_RXIDLE, handler=rx_idle_callback)
+
+# Automatic garbage collection could kick in part way through a burst; instead collect at a known quiet
+# point, once the burst has been parsed and reported. Anything added under "Do Other Stuff" that allocates
+# heavily should call gc.collect() itself
+gc.disable()
+
+# Main Infinite Loop
+while 1:
+    # Do Other Stuff Here.......
+
+    # Update the GPS Object when flag is tripped
+    if new_data:
+        new_data = False  # Clear the flag before draining so a burst arriving meanwhile is not missed
+        while uart.any():
+            my_gps.update_bytes(uart.read(uart.any()))
+
+        # Build the whole report first and write it out in one go
+        sys.stdout.write(REPORT.format(my_gps.timestamp, my_gps.date_string('long'), my_gps.latitude_string(),
+                                       my_gps.longitude_string(), my_gps.hdop))
+        gc.collect()
@@ -3,20 +3,25 @@ from micropyGPS import MicropyGPS
 
 uart = UART(3, 9600)
 
+# Largest number of bytes pulled from the UART in one read
+READ_CHUNK = 64
+
 my_gps = MicropyGPS()
 
 
 # Reads 300 sentences and reports how many were parsed and if any failed the CRC check
 sentence_count = 0
 while True:
-    if uart.any():
-        stat = my_gps.update(chr(uart.readchar()))
-        if stat:
-            print(stat)
-            stat = None
-            sentence_count += 1
-    if sentence_count == 300:
-        break;    
+    n = uart.any()
+    if n:
+        for b in uart.read(min(n, READ_CHUNK)):
+            stat = my_gps.update(b)
+            if stat:
+                print(stat)
+                stat = None
+                sentence_count += 1
+    if sentence_count >= 300:
+        break
 
 
 print('Sentences Found:', my_gps.clean_sentences)
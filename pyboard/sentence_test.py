@@ -4,23 +4,45 @@
 # If you are having issues receiving sentences, use UART_test.py to ensure
 # your UART is hooked up and configured correctly
 
+import micropython
+import uselect
 from pyb import UART
 from micropyGPS import MicropyGPS
 
 # Setup the connection to your GPS here
 # This example uses UART 3 with RX on pin Y10
 # Baudrate is 9600bps, with the standard 8 bits, 1 stop bit, no parity
-uart = UART(3, 9600)
+# The receive buffer is enlarged from the default so bursts of sentences aren't dropped while the parser
+# or print() is busy, and reads never wait for more characters (timeout=0) than are already buffered.
+# If your GPS module breaks out CTS/RTS, wire them up and add flow=UART.RTS | UART.CTS for higher baud rates
+uart = UART(3, 9600, read_buf_len=1024, timeout=0, timeout_char=2)
+
+# Largest number of bytes pulled from the UART in one read; bounds the time spent in each pass through the loop
+READ_CHUNK = 64
 
 # Instatntiate the micropyGPS object
 my_gps = MicropyGPS()
 
+# Register the UART with a poll object so the loop sleeps until characters arrive instead of spinning on uart.any()
+poller = uselect.poll()
+poller.register(uart, uselect.POLLIN)
+
+
 # Continuous Tests for characters available in the UART buffer, any characters are feed into the GPS
 # object. When enough char are feed to represent a whole, valid sentence, stat is set as the name of the
 # sentence and printed
-while True:
-    if uart.any():
-        stat = my_gps.update(chr(uart.readchar())) # Note the conversion to to chr, UART outputs ints normally
-        if stat:
-            print(stat)
-            stat = None
+# The loop is compiled to native machine code rather than bytecode since it runs for every burst received
+@micropython.native
+def run(uart, poller, my_gps):
+    while True:
+        poller.poll()
+        n = uart.any()
+        if n:
+            # Read everything waiting in one call and hand the whole buffer to the parser at once
+            stat = my_gps.update_bytes(uart.read(min(n, READ_CHUNK)))
+            if stat:
+                print(stat)
+                stat = None
+
+
+run(uart, poller, my_gps)
@@ -1,3 +1,4 @@
+import sys
 from pyb import UART
 
 # Setup the connection to your GPS here
@@ -6,8 +7,8 @@ from pyb import UART
 uart = UART(3, 9600)
 
 # Basic UART --> terminal printer, use to test your GPS module
+# Everything waiting in the UART is read and written to the terminal in one go rather than a char at a time
 while True:
-    if uart.any():
-        print(chr(uart.readchar()), end='')
-
-
+    n = uart.any()
+    if n:
+        sys.stdout.write(uart.read(n))
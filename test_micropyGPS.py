@@ -305,6 +305,13 @@ def test_gsa_sentences():
     assert my_gps.clean_sentences == len(test_GSA)
     assert my_gps.parsed_sentences == len(test_GSA)
     assert my_gps.crc_fails == 0
+    # Truncated sentences, and ones with no DOP values yet, are rejected; the checksum isn't read as the VDOP
+    dops = (my_gps.pdop, my_gps.hdop, my_gps.vdop)
+    assert my_gps.update_bytes(b'$GPGSA,A,3,07,11,28,24,26,08,17,,,,,,2.0,1.1*33\n') is None
+    assert my_gps.update_bytes(b'$GPGSA,A,3,07,11,28,24,26,08,17,,,,,,2.0*31\n') is None
+    assert my_gps.update_bytes(b'$GPGSA,A,3,07,11,28,24,26,08,17,,,,,,,,*1D\n') is None
+    assert (my_gps.pdop, my_gps.hdop, my_gps.vdop) == dops
+    assert my_gps.crc_fails == 0
 
 
 def test_gsv_sentences():
@@ -409,16 +416,27 @@ def test_pretty_print():
     print('Latitude:', my_gps.latitude_string())
     assert my_gps.longitude_string() == "83° 38.7865' W"
     print('Longitude:', my_gps.longitude_string())
+    assert my_gps.position_string() == "37° 49.1802' N, 83° 38.7865' W"
+    print('Position:', my_gps.position_string())
     assert my_gps.speed_string('kph') == '4.2596 km/h'
     print('Speed:', my_gps.speed_string('kph'), 'or', my_gps.speed_string('mph'), 'or', my_gps.speed_string('knot'))
     assert my_gps.speed_string('mph') == '2.6473 mph'
     assert my_gps.speed_string('knot') == '2.3 knots'
     assert my_gps.date_string('long') == 'May 28th, 2011'
     print('Date (Long Format):', my_gps.date_string('long'))
+    my_gps.date = (23, 5, 11)
+    assert my_gps.date_string('long') == 'May 23rd, 2011'
+    my_gps.date = (3, 5, 1)
+    assert my_gps.date_string('long') == 'May 3rd, 2001'
+    # Dates assigned as lists are reused from the cache like those stored by the parsers
+    my_gps.date = [28, 5, 11]
     assert my_gps.date_string('s_dmy') == '28/05/11'
+    assert my_gps.date_string('s_dmy') is my_gps.date_string('s_dmy')
     print('Date (Short D/M/Y Format):', my_gps.date_string('s_dmy'))
     assert my_gps.date_string('s_mdy') == '05/28/11'
     print('Date (Short M/D/Y Format):', my_gps.date_string('s_mdy'))
+    assert my_gps.status_string() == "05/28/11 18:00:50 37° 49.1802' N, 83° 38.7865' W 4.2596 km/h"
+    print('Status:', my_gps.status_string())
 
 
 def test_coordinate_representations():
@@ -435,4 +453,120 @@ def test_coordinate_representations():
     print('Degrees Minutes Seconds Latitude:', my_gps.latitude_string())
     assert my_gps.latitude_string() == """53° 21' 41" N"""
     assert my_gps.longitude_string() == """6° 30' 20" W"""
+    assert my_gps.position_string() == """53° 21' 41" N, 6° 30' 20" W"""
     print('Degrees Minutes Seconds Longitude:', my_gps.longitude_string())
+
+
+def test_update_bytes():
+    my_gps = MicropyGPS()
+    print('')
+    all_sentences = test_RMC + test_VTG + test_GGA + test_GSA + test_GSV + test_GLL
+    sentence = my_gps.update_bytes(''.join(all_sentences).encode())
+    assert sentence == "GPGLL"
+    print('Last Parsed Sentence:', sentence)
+    assert my_gps.gps_segments == gll_parsed_string[-1]
+    assert my_gps.clean_sentences == len(all_sentences)
+    assert my_gps.parsed_sentences == len(all_sentences)
+    assert my_gps.crc_fails == 0
+    assert my_gps.satellite_data == gsv_sat_data[-1]
+    assert my_gps.satellites_used == gsa_sats_used[-1]
+    for RMC_sentence in test_RMC:
+        assert my_gps.update_bytes(memoryview(RMC_sentence.encode())) == "GPRMC"
+    assert my_gps.latitude == rmc_latitude[-1]
+    assert my_gps.longitude == rmc_longitude[-1]
+    assert my_gps.update_bytes(b'') is None
+
+
+def test_update_bytes_chunked():
+    all_sentences = ''.join(test_RMC + test_VTG + test_GGA + test_GSA + test_GSV + test_GLL)
+    # Noise, a broken sentence and a bad CRC mixed in between clean sentences
+    stream = ('\x00' + all_sentences[:40] + '\xff' + all_sentences + '$GPGSA,A,3,07,11*00\n' +
+              all_sentences).encode('latin-1')
+    char_gps = MicropyGPS()
+    for y in stream.decode('latin-1'):
+        char_gps.update(y)
+    # Integer byte values, as yielded by iterating over uart.read(), parse the same as chars
+    int_gps = MicropyGPS()
+    for b in stream:
+        int_gps.update(b)
+    assert int_gps.gps_segments == char_gps.gps_segments
+    assert int_gps.parsed_sentences == char_gps.parsed_sentences
+    assert int_gps.crc_fails == char_gps.crc_fails
+    assert int_gps.satellite_data == char_gps.satellite_data
+    for chunk_size in (1, 5, 64, 1000):
+        my_gps = MicropyGPS()
+        for i in range(0, len(stream), chunk_size):
+            my_gps.update_bytes(stream[i:i + chunk_size])
+        assert my_gps.gps_segments == char_gps.gps_segments
+        assert my_gps.crc_xor == char_gps.crc_xor
+        assert my_gps.clean_sentences == char_gps.clean_sentences
+        assert my_gps.parsed_sentences == char_gps.parsed_sentences
+        assert my_gps.crc_fails == char_gps.crc_fails == 1
+        assert my_gps.satellite_data == char_gps.satellite_data
+        assert my_gps.timestamp == char_gps.timestamp
+        assert my_gps.latitude == char_gps.latitude
+        assert my_gps.longitude == char_gps.longitude
+
+
+def test_custom_sentence_parser():
+    def gnxxx(gps):
+        gps.satellites_in_use = int(gps.gps_segments[1])
+        return True
+
+    my_gps = MicropyGPS()
+    # Sentence types registered after the object exists are picked up as well
+    MicropyGPS.supported_sentences['GNXXX'] = gnxxx
+    try:
+        sentence = my_gps.update_bytes(b'$GNXXX,42,hello*35\n')
+        assert sentence == "GNXXX"
+        assert my_gps.satellites_in_use == 42
+        assert MicropyGPS().update_bytes(b'$GNXXX,7,hello*04\n') == "GNXXX"
+    finally:
+        del MicropyGPS.supported_sentences['GNXXX']
+    assert my_gps.update_bytes(b'$GNXXX,42,hello*35\n') is None
+
+
+def test_unpadded_coordinates():
+    my_gps = MicropyGPS()
+    # Receivers that don't zero-pad degrees, down to none at all for 0 degrees
+    assert my_gps.update_bytes(b'$GPRMC,092751.000,A,5321.6802,N,630.3371,W,0.06,31.66,280511,,,A*45\n') == "GPRMC"
+    assert my_gps.longitude == [6, 30.3371, 'W']
+    assert my_gps.update_bytes(b'$GPRMC,092751.000,A,5321.6802,N,30.3371,W,0.06,31.66,280511,,,A*73\n') == "GPRMC"
+    assert my_gps.longitude == [0, 30.3371, 'W']
+    assert my_gps.update_bytes(b'$GPGLL,21.6802,N,630.3371,W,092751.000,A,A*4F\n') == "GPGLL"
+    assert my_gps.latitude == [0, 21.6802, 'N']
+    assert my_gps.longitude == [6, 30.3371, 'W']
+    assert my_gps.update_bytes(b'$GPGGA,092751.000,5321.6802,N,30.3371,W,1,08,1.03,61.7,M,55.3,M,,*73\n') == "GPGGA"
+    assert my_gps.latitude == [53, 21.6802, 'N']
+    assert my_gps.longitude == [0, 30.3371, 'W']
+    # Fewer than two digits before the decimal point can't hold the minutes
+    assert my_gps.update_bytes(b'$GPRMC,092751.000,A,5321.6802,N,0.3371,W,0.06,31.66,280511,,,A*40\n') is None
+    assert my_gps.longitude == [0, 30.3371, 'W']
+
+
+def test_swapped_hemispheres():
+    my_gps = MicropyGPS()
+    assert my_gps.update_bytes(test_RMC[5].encode()) == "GPRMC"
+    # Sentences with a longitude hemisphere on the latitude, or the other way round, are rejected
+    assert my_gps.update_bytes(b'$GPRMC,092751.000,A,5321.6802,E,00630.3371,W,0.06,31.66,280511,,,A*4E\n') is None
+    assert my_gps.update_bytes(b'$GPGGA,092751.000,5321.6802,N,00630.3371,N,1,08,1.03,61.7,M,55.3,M,,*5C\n') is None
+    assert my_gps.update_bytes(b'$GPGLL,5321.6802,W,00630.3371,S,092751.000,A,A*54\n') is None
+    assert my_gps.crc_fails == 0
+    assert my_gps._latitude == rmc_latitude[5]
+    assert my_gps._longitude == rmc_longitude[5]
+
+
+def test_gsv_edge_cases():
+    my_gps = MicropyGPS()
+    # A last satellite sent without an SNR field; the checksum that follows is not read as one
+    assert my_gps.update_bytes(b'$GPGSV,1,1,01,28,72,355*68\n') == "GPGSV"
+    assert my_gps.satellite_data == {28: (72, 355, None)}
+    # A non-numeric elevation, azimuth or SNR is stored as None, as an empty one is
+    assert my_gps.update_bytes(b'$GPGSV,1,1,02,28,72,355,39,01,x2,063,33*33\n') == "GPGSV"
+    assert my_gps.satellites_in_view == 2
+    assert my_gps.satellite_data == {28: (72, 355, 39), 1: (None, 63, 33)}
+    # A non-numeric PRN rejects the whole sentence
+    assert my_gps.update_bytes(b'$GPGSV,1,1,02,28,72,355,39,x1,52,063,33*36\n') is None
+    assert my_gps.crc_fails == 0
+    assert my_gps.satellites_in_view == 2
+    assert my_gps.satellite_data == {28: (72, 355, 39), 1: (None, 63, 33)}